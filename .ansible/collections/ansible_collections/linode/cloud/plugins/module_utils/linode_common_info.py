@@ -128,6 +128,9 @@ class InfoModule(LinodeModuleBase):
         deprecation_message: Optional[str] = None,
         custom_options: Optional[Dict[str, SpecField]] = None,
     ) -> None:
+        # The spec is built lazily and reused across accesses
+        self._spec: Optional[SpecDocMeta] = None
+
         self.primary_result = primary_result
         self.secondary_results = secondary_results or []
         self.attributes = attributes or []
@@ -217,11 +220,17 @@ class InfoModule(LinodeModuleBase):
         return self.results
 
     @property
-    def spec(self):
+    def spec(self) -> SpecDocMeta:
         """
         Returns the ansible-specdoc spec for this module.
         """
 
+        if self._spec is None:
+            self._spec = self._build_spec()
+
+        return self._spec
+
+    def _build_spec(self) -> SpecDocMeta:
         options = {}
 
         options.update(self.custom_options)
@@ -62,6 +62,9 @@ class ListModule(
         custom_options: Optional[Dict[str, SpecField]] = None,
         custom_field_resolver: Optional[callable] = None,
     ) -> None:
+        # The spec is built lazily and reused across accesses
+        self._spec: Optional[SpecDocMeta] = None
+
         self.result_display_name = result_display_name
         self.result_field_name = result_field_name
         self.endpoint_template = endpoint_template
@@ -118,10 +121,17 @@ class ListModule(
         return self.results
 
     @property
-    def spec(self):
+    def spec(self) -> SpecDocMeta:
         """
         Returns the ansible-specdoc spec for this module.
         """
+
+        if self._spec is None:
+            self._spec = self._build_spec()
+
+        return self._spec
+
+    def _build_spec(self) -> SpecDocMeta:
         spec_filter = {
             "name": SpecField(
                 type=FieldType.string,
@@ -1,5 +1,7 @@
 """This module contains helper functions for various Linode modules."""
 
+import time
+from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
 import linode_api4
@@ -115,12 +117,17 @@ def handle_updates(
     mutable_fields: set,
     register_func: Any,
     ignore_keys: Set[str] = None,
+    refresh: bool = True,
 ) -> Set[str]:
-    """Handles updates for a linode_api4 object"""
+    """
+    Handles updates for a linode_api4 object.
+    If refresh is False, the object is assumed to have just been fetched.
+    """
 
     ignore_keys = ignore_keys or set()
 
-    obj._api_get()
+    if refresh:
+        obj._api_get()
 
     # We need the type to access property metadata
     property_metadata = type(obj).properties
@@ -132,7 +139,9 @@ def handle_updates(
     result = set()
 
     for key, new_value in params.items():
-        if not hasattr(obj, key) or key in ignore_keys:
+        # Check ignore_keys first; hasattr can trigger a request for
+        # derived attributes
+        if key in ignore_keys or not hasattr(obj, key):
             continue
 
         old_value = parse_linode_types(getattr(obj, key))
@@ -180,6 +189,18 @@ def handle_updates(
     return result
 
 
+def cached_api_get(obj: linode_api4.Base, ttl: float = 0.5) -> None:
+    """
+    Refreshes the given linode_api4 object unless it was populated
+    within the last `ttl` seconds.
+    """
+
+    if datetime.now() - obj._last_updated < timedelta(seconds=ttl):
+        return
+
+    obj._api_get()
+
+
 def parse_linode_types(value: any) -> any:
     """Helper function for handle_updates.
     Parses Linode Object types into collections of strings."""
@@ -343,17 +364,48 @@ def format_generic_error(err: Exception) -> str:
 
 
 def poll_condition(
-    condition_func: Callable[[], bool], step: int, timeout: int
+    condition_func: Callable[[], bool],
+    step: float,
+    timeout: int,
+    backoff_factor: float = 1.0,
+    max_step: Optional[float] = None,
 ) -> None:
-    """Polls for the given condition using the given step and timeout values."""
-    # Initial attempt
-    if condition_func():
-        return
+    """
+    Polls for the given condition using the given step and timeout values.
+
+    If a backoff factor is specified, the step is multiplied by the factor
+    after every failed attempt, optionally capped at max_step.
+    """
+    deadline = time.monotonic() + timeout
+    final_attempt_made = False
+
+    def __condition() -> bool:
+        nonlocal final_attempt_made
+
+        # polling only checks the timeout after each attempt, so we need to
+        # stop it from polling again once the deadline has passed.
+        # A single attempt is always made at or after the deadline so the
+        # final (clamped) sleep isn't wasted.
+        if final_attempt_made:
+            raise polling.TimeoutException([], None)
+
+        final_attempt_made = time.monotonic() >= deadline
+        return condition_func()
+
+    def __next_step(current: float) -> float:
+        next_step = current * backoff_factor
+
+        if max_step is not None:
+            next_step = min(next_step, max_step)
+
+        # Don't sleep past the deadline
+        return max(min(next_step, deadline - time.monotonic()), 0)
 
     polling.poll(
-        condition_func,
-        step=step,
+        __condition,
+        step=min(step, max(timeout, 0)),
         timeout=timeout,
+        step_function=__next_step,
     )
 
 
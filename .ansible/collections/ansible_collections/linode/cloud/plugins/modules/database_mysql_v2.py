@@ -5,8 +5,9 @@
 
 from __future__ import absolute_import, division, print_function
 
-import copy
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.database_mysql_v2 as docs
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
@@ -23,7 +24,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_requirements,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
-    filter_null_values_recursive,
+    cached_api_get,
     handle_updates,
     mapping_to_dict,
     poll_condition,
@@ -136,6 +137,66 @@ SPECDOC_META = SpecDocMeta(
     },
 )
 
+# The Ansible argument spec is only computed once at import time
+ANSIBLE_SPEC = SPECDOC_META.ansible_spec
+
+# Fields that are passed through to the create request
+CREATE_FIELDS = {
+    "allow_list",
+    "cluster_size",
+    "engine",
+    "fork",
+    "label",
+    "region",
+    "type",
+}
+
+# Fields that can be updated on an existing database
+MUTABLE_FIELDS = {
+    "label",
+    "allow_list",
+    "cluster_size",
+    "updates",
+    "type",
+    "version",
+}
+
+# User-specified fields that may result in an update; `label` is excluded
+# because it is used to look up the database
+EDITABLE_FIELDS = {"allow_list", "cluster_size", "engine", "type", "updates"}
+
+
+def _filter_create_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the non-null create fields from the given params.
+    Create fields are at most one dict deep (e.g. `fork`), so only one level
+    of nested null values needs to be removed.
+    """
+    result = {}
+
+    for key in CREATE_FIELDS:
+        value = params.get(key)
+        if value is None:
+            continue
+
+        if isinstance(value, dict):
+            value = {k: v for k, v in value.items() if v is not None}
+
+        result[key] = value
+
+    return result
+
+
+@lru_cache(maxsize=32)
+def _parse_engine_major_version(engine: str) -> int:
+    """Returns the major version of the given engine (e.g. mysql/8 -> 8)."""
+    _, _, version = engine.partition("/")
+
+    if not version:
+        raise ValueError(f"Invalid engine: {engine}")
+
+    return int(version)
+
 
 DOCUMENTATION = r"""
 author:
@@ -361,7 +422,7 @@ class Module(LinodeModuleBase):
     """Module implementation for database_mysql_v2."""
 
     def __init__(self) -> None:
-        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.module_arg_spec = ANSIBLE_SPEC
         self.results = {
             "changed": False,
             "actions": [],
@@ -375,22 +436,7 @@ class Module(LinodeModuleBase):
         )
 
     def _create(self) -> MySQLDatabase:
-        params = filter_null_values_recursive(
-            {
-                k: v
-                for k, v in self.module.params.items()
-                if k
-                in [
-                    "allow_list",
-                    "cluster_size",
-                    "engine",
-                    "fork",
-                    "label",
-                    "region",
-                    "type",
-                ]
-            }
-        )
+        params = _filter_create_params(self.module.params)
 
         # This is necessary because `type` is a Python-reserved keyword
         if "type" in params:
@@ -414,43 +460,33 @@ class Module(LinodeModuleBase):
             timeout=self._timeout_ctx.seconds_remaining,
         )
 
-        # The `updates` field is not currently supported in the POST
-        # request body.
-        updates = params.get("updates")
-        if updates is not None:
-            database.updates = params.get("updates")
-            database.save()
-
-            wait_for_database_status(
-                self.client,
-                database,
-                "active",
-                timeout=self._timeout_ctx.seconds_remaining,
-            )
-
+        # NOTE: The `updates` field is not currently supported in the POST
+        # request body, so it is applied by _update after creation.
         return database
 
-    def _update(self, database: MySQLDatabase) -> None:
-        database._api_get()
+    def _update(self, database: MySQLDatabase) -> Set[str]:
+        # There is nothing to update if no editable fields were specified
+        if all(self.module.params.get(k) is None for k in EDITABLE_FIELDS):
+            return set()
+
+        cached_api_get(database)
 
-        params = copy.deepcopy(self.module.params)
+        # Only the `updates` dict is mutated below, so a shallow copy is enough
+        params = self.module.params.copy()
+        if params.get("updates") is not None:
+            params["updates"] = params["updates"].copy()
 
         # The database PUT endpoint accepts `version` rather than `engine`
         engine = params.pop("engine", None)
         if engine is not None:
-            engine_components = engine.split("/")
-
-            if len(engine_components) < 2:
-                raise ValueError(f"Invalid engine: {engine}")
-
-            major_version = int(engine_components[1])
+            major_version = _parse_engine_major_version(engine)
 
             # Evil hack to correct for the API returning a three-part value for the
             # `version` field while the user specifies the major version, while still
             # using handle_updates.
             #
             # If anyone can think of a better way to do this, please correct it :)
-            if int(database.version.split(".")[0]) != major_version:
+            if int(database.version.partition(".")[0]) != major_version:
                 params["version"] = major_version
 
         # The `updates` field is returned with an additional `pending` key that isn't
@@ -458,24 +494,19 @@ class Module(LinodeModuleBase):
         if "updates" in params and params["updates"] is not None:
             params["updates"]["pending"] = database.updates.pending
 
-        # Apply updates
+        # Apply updates; the database was refreshed at the start of this method
+        # and handle_updates only sends a PUT if a field differs
         updated_fields = handle_updates(
             database,
             params,
-            {
-                "label",
-                "allow_list",
-                "cluster_size",
-                "updates",
-                "type",
-                "version",
-            },
+            MUTABLE_FIELDS,
             self.register_action,
+            refresh=False,
         )
 
         # NOTE: We don't poll for the database_update event here because it is not
         # triggered under all conditions.
-        if len(updated_fields) > 0:
+        if updated_fields:
             wait_for_database_status(
                 self.client,
                 database,
@@ -488,49 +519,56 @@ class Module(LinodeModuleBase):
         if "cluster_size" in updated_fields:
 
             def __poll_condition() -> bool:
-                database._api_get()
+                cached_api_get(database)
                 return database.cluster_size == params["cluster_size"]
 
             poll_condition(
                 __poll_condition,
                 timeout=self._timeout_ctx.seconds_remaining,
-                step=1,
+                step=5,
+                backoff_factor=2.0,
+                max_step=30,
             )
 
-    def _populate_results(self, database: MySQLDatabase) -> None:
-        database._api_get()
+        return updated_fields
 
-        self.results["database"] = database._raw_json
-        self.results["credentials"] = call_protected_provisioning(
-            lambda: mapping_to_dict(database.credentials)
-        )
-        self.results["ssl_cert"] = call_protected_provisioning(
-            lambda: mapping_to_dict(database.ssl)
-        )
+    def _populate_results(
+        self, database: MySQLDatabase, refresh: bool = True
+    ) -> None:
+        if refresh:
+            cached_api_get(database)
 
-    def _handle_present(self) -> None:
-        params = self.module.params
+        self.results["database"] = database._raw_json
 
-        result = safe_find(
-            self.client.database.mysql_instances,
-            MySQLDatabase.label == params.get("label"),
-        )
-        if result is None:
-            result = self._create()
-            self.register_action("Created MySQL database {0}".format(result.id))
+        # The credentials and SSL certificate are independent requests,
+        # so we can fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            credentials_future = executor.submit(
+                call_protected_provisioning,
+                lambda: mapping_to_dict(database.credentials),
+            )
+            ssl_cert_future = executor.submit(
+                call_protected_provisioning,
+                lambda: mapping_to_dict(database.ssl),
+            )
 
-        self._update(result)
+            self.results["credentials"] = credentials_future.result()
+            self.results["ssl_cert"] = ssl_cert_future.result()
 
-        self._populate_results(result)
+    def _handle_present(self, database: Optional[MySQLDatabase]) -> None:
+        if database is None:
+            database = self._create()
+            self.register_action(
+                "Created MySQL database {0}".format(database.id)
+            )
 
-    def _handle_absent(self) -> None:
-        params = self.module.params
+        updated_fields = self._update(database)
 
-        database = safe_find(
-            self.client.database.mysql_instances,
-            MySQLDatabase.label == params.get("label"),
-        )
+        # The database has either just been fetched or refreshed by _update,
+        # so we only need to re-fetch it if something was changed
+        self._populate_results(database, refresh=bool(updated_fields))
 
+    def _handle_absent(self, database: Optional[MySQLDatabase]) -> None:
         if database is not None:
             self._populate_results(database)
 
@@ -542,10 +580,16 @@ class Module(LinodeModuleBase):
         """Entrypoint for token module"""
         state = kwargs.get("state")
 
+        # Resolve the database once and share it between the state handlers
+        database = safe_find(
+            self.client.database.mysql_instances,
+            MySQLDatabase.label == kwargs.get("label"),
+        )
+
         if state == "absent":
-            self._handle_absent()
+            self._handle_absent(database)
         else:
-            self._handle_present()
+            self._handle_present(database)
 
         return self.results
 
@@ -5,7 +5,8 @@
 
 from __future__ import absolute_import, division, print_function
 
-from typing import Any, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.domain_record as docs
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
@@ -16,8 +17,8 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_requirements,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
-    filter_null_values,
     handle_updates,
+    safe_find,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -158,6 +159,23 @@ MUTABLE_FIELDS: Set[str] = {
     "weight",
 }
 
+# Fields that are passed through to the create request alongside `type`
+CREATE_FIELDS = {
+    "name",
+    "port",
+    "priority",
+    "protocol",
+    "service",
+    "tag",
+    "target",
+    "ttl_sec",
+    "weight",
+}
+
+# Fields that are diffed against an existing record.
+# `type` cannot be updated but is still checked so mismatches are reported.
+UPDATE_FIELDS = tuple(MUTABLE_FIELDS | {"type"})
+
 DOCUMENTATION = r"""
 author:
 - Luke Murphy (@decentral1se)
@@ -354,15 +372,21 @@ class LinodeDomainRecord(LinodeModuleBase):
         target = target.removesuffix(".")
 
         try:
-            for record in domain.records:
-                if (
-                    record.name == name
-                    and record.type == rtype
-                    and record.target == target
-                ):
-                    return record
+            record_index: Dict[Tuple[str, str, str], DomainRecord] = {}
+
+            for record in list(domain.records):
+                # Listed records are fully populated, so we can read the
+                # raw JSON rather than going through linode_api4's
+                # lazy-loading attribute access
+                raw = record._raw_json
+
+                # Keep the first matching record for each key
+                record_index.setdefault(
+                    (raw.get("name"), raw.get("type"), raw.get("target")),
+                    record,
+                )
 
-            return None
+            return record_index.get((name, rtype, target))
         except IndexError:
             return None
         except Exception as exception:
@@ -372,23 +396,12 @@ class LinodeDomainRecord(LinodeModuleBase):
                 )
             )
 
-    def _get_domain_by_name(self, name: str) -> Optional[Domain]:
-        try:
-            domain = self.client.domains(Domain.domain == name)[0]
-            return domain
-        except IndexError:
-            return None
-        except Exception as exception:
-            return self.fail(
-                msg="failed to get domain {0}: {1}".format(name, exception)
-            )
-
     def _get_domain_from_params(self) -> Optional[Domain]:
         domain_id = self.module.params.get("domain_id")
         domain = self.module.params.get("domain")
 
         if domain is not None:
-            return self._get_domain_by_name(domain)
+            return safe_find(self.client.domains, Domain.domain == domain)
 
         if domain_id is not None:
             result = Domain(self.client, domain_id)
@@ -419,47 +432,92 @@ class LinodeDomainRecord(LinodeModuleBase):
 
         return None
 
+    def _resolve_domain_and_record(self) -> None:
+        """Resolves the Domain and Domain record targeted by the module params"""
+
+        params = self.module.params
+
+        domain_id = params.get("domain_id")
+        record_id = params.get("record_id")
+
+        # If both IDs are known, the domain and record
+        # can be fetched concurrently
+        if (
+            params.get("domain") is None
+            and domain_id is not None
+            and record_id is not None
+        ):
+            self._domain = Domain(self.client, domain_id)
+            self._record = DomainRecord(self.client, record_id, domain_id)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self._domain._api_get),
+                    executor.submit(self._record._api_get),
+                ]
+
+                for future in futures:
+                    future.result()
+
+            return
+
+        self._domain = self._get_domain_from_params()
+        if self._domain is None:
+            return self.fail("invalid domain specified")
+
+        self._record = self._get_record_from_params()
+
     def _create_record(self) -> Optional[DomainRecord]:
         params = self.module.params
-        record_type = params.pop("type")
+        record_type = params.get("type")
         record_name = params.get("name")
         record_service = params.get("service")
 
+        create_params = {
+            k: params[k] for k in CREATE_FIELDS if params.get(k) is not None
+        }
+
         try:
             self.register_action(
                 "Created domain record type {0}: name is {1}; service is {2}".format(
                     record_type, record_name, record_service
                 )
             )
-            return self._domain.record_create(record_type, **params)
+            record = self._domain.record_create(record_type, **create_params)
+            return record
         except Exception as exception:
             return self.fail(
                 msg="failed to create domain record: {0}".format(exception)
             )
 
-    def _update_record(self) -> None:
+    def _update_record(self) -> Set[str]:
         """Handles all update functionality for the current Domain record"""
 
-        handle_updates(
+        params = self.module.params
+
+        # Skip refreshing and diffing the record if nothing could differ.
+        # `type` is compared locally so mismatches are still reported below.
+        has_mutable = any(params.get(k) is not None for k in MUTABLE_FIELDS)
+        type_matches = params.get("type") in (None, self._record.type)
+
+        if not has_mutable and type_matches:
+            return set()
+
+        return handle_updates(
             self._record,
-            filter_null_values(self.module.params),
+            {k: params[k] for k in UPDATE_FIELDS if params.get(k) is not None},
             MUTABLE_FIELDS,
             self.register_action,
-            ignore_keys={"name", "record", "target"},
         )
 
     def _handle_present(self) -> None:
         params = self.module.params
 
-        self._domain = self._get_domain_from_params()
-        if self._domain is None:
-            return self.fail("invalid domain specified")
+        self._resolve_domain_and_record()
 
         record_name = params.get("name")
         record_id = params.get("record_id")
 
-        self._record = self._get_record_from_params()
-
         if self._record is None and record_id is not None:
             return self.fail(
                 "record with id {0} does not exist".format(record_id)
@@ -470,19 +528,31 @@ class LinodeDomainRecord(LinodeModuleBase):
         ):
             self._record = self._create_record()
 
-        self._update_record()
+        updated_fields = self._update_record()
 
-        # Force lazy-loading
-        self._record._api_get()
+        # handle_updates refreshes the record before diffing it,
+        # so we only need to re-fetch it if it was changed
+        if updated_fields:
+            self._record._api_get()
 
         self.results["record"] = self._record._raw_json
 
     def _handle_absent(self) -> None:
-        self._domain = self._get_domain_from_params()
-        if self._domain is None:
-            return self.fail("invalid domain specified")
+        params = self.module.params
 
-        self._record = self._get_record_from_params()
+        domain_id = params.get("domain_id")
+        record_id = params.get("record_id")
+
+        # The domain itself isn't needed to delete a record by ID
+        if (
+            params.get("domain") is None
+            and domain_id is not None
+            and record_id is not None
+        ):
+            self._record = DomainRecord(self.client, record_id, domain_id)
+            self._record._api_get()
+        else:
+            self._resolve_domain_and_record()
 
         if self._record is not None:
             recordid = self._record.id
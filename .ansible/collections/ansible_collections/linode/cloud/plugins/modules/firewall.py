@@ -5,8 +5,8 @@
 
 from __future__ import absolute_import, division, print_function
 
-import copy
 import ipaddress
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.firewall as docs
@@ -18,7 +18,6 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_requirements,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
-    filter_null_values,
     filter_null_values_recursive,
     handle_updates,
     mapping_to_dict,
@@ -189,7 +188,7 @@ SPECDOC_META = SpecDocMeta(
 )
 
 # Fields that can be updated on an existing Firewall
-MUTABLE_FIELDS: List[str] = ["status", "tags"]
+MUTABLE_FIELDS = {"status", "tags"}
 
 DOCUMENTATION = r"""
 author:
@@ -461,6 +460,18 @@ firewall:
   type: dict
 """
 
+RULE_SPEC_FIELDS = frozenset(linode_firewall_rule_spec)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_ipv4_network(address: str) -> str:
+    return str(ipaddress.IPv4Network(address))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_ipv6_network(address: str) -> str:
+    return str(ipaddress.IPv6Network(address))
+
 
 class LinodeFirewall(LinodeModuleBase):
     """Module for creating and destroying Linode Firewalls"""
@@ -476,6 +487,7 @@ class LinodeFirewall(LinodeModuleBase):
         }
 
         self._firewall: Optional[Firewall] = None
+        self._devices: Optional[List[FirewallDevice]] = None
 
         self._state = "present"
 
@@ -524,86 +536,99 @@ class LinodeFirewall(LinodeModuleBase):
 
     def _update_devices(self, spec_devices: list) -> None:
         # Remove devices that are not present in config
-        device_map = {}
-
-        for device in self._firewall.devices:
-            device_map[device.entity.id] = device
+        devices = list(self._firewall.devices)
+        device_map = {device.entity.id: device for device in devices}
+        changed = False
 
         # Handle creating/keeping existing devices
         for device in spec_devices:
             device_entity_id = device.get("id")
             device_entity_type = device.get("type")
 
-            if device_entity_id in device_map:
-                if (
-                    device_map[device_entity_id].entity.type
-                    == device_entity_type
-                ):
-                    del device_map[device_entity_id]
+            existing_device = device_map.pop(device_entity_id, None)
+
+            if existing_device is not None:
+                if existing_device.entity.type == device_entity_type:
                     continue
 
                 # Recreate the device if the fields don't match
-                self._delete_device(device_map[device_entity_id])
+                self._delete_device(existing_device)
 
             self._create_device(device_entity_id, device_entity_type)
+            changed = True
 
         # Delete unused devices
         for device in device_map.values():
             self._delete_device(device)
+            changed = True
+
+        # The fetched devices can be reused for the results
+        # as long as nothing was added or removed
+        self._devices = None if changed else devices
 
     @staticmethod
     def _normalize_ips(rules: list) -> list:
         result = []
         for rule in rules:
-            item = copy.deepcopy(rule)
+            # Only the addresses are replaced below, so a deep copy
+            # of the rule isn't necessary
+            item = dict(rule)
+
+            addresses = rule.get("addresses")
 
-            addresses = rule.get("addresses", [])
+            if addresses is not None:
+                addresses = dict(addresses)
+                item["addresses"] = addresses
 
-            if "ipv6" in addresses:
-                item["addresses"]["ipv6"] = [
-                    str(ipaddress.IPv6Network(v)) for v in addresses["ipv6"]
-                ]
+                if "ipv6" in addresses:
+                    addresses["ipv6"] = [
+                        _normalize_ipv6_network(v) for v in addresses["ipv6"]
+                    ]
 
-            if "ipv4" in addresses:
-                item["addresses"]["ipv4"] = [
-                    str(ipaddress.IPv4Network(v)) for v in addresses["ipv4"]
-                ]
+                if "ipv4" in addresses:
+                    addresses["ipv4"] = [
+                        _normalize_ipv4_network(v) for v in addresses["ipv4"]
+                    ]
 
             result.append(item)
 
         return result
 
     @staticmethod
-    def _amend_rules(remote_rules: list, local_rules: list) -> list:
+    def _amend_rules(remote_rules: list, local_labeled_rules: dict) -> list:
         # produce a result list in the same order as remote_rules
-        # amended by the updates from the local_rules
+        # amended by the updates from the local_rules, followed by
+        # any new local_rules; consumes local_labeled_rules
 
-        local_labeled_rules = {r["label"]: r for r in local_rules}
         result = []
         for remote_rule in remote_rules:
+            local_rule = local_labeled_rules.pop(remote_rule["label"], None)
+
             # copy remote_rule as is if not being updated by local_rules
-            if remote_rule["label"] not in local_labeled_rules:
+            if local_rule is None:
                 result.append(remote_rule)
                 continue
 
             # insert all missing fields in local_rule from remote_rule
-            local_rule = local_labeled_rules[remote_rule["label"]]
-            for field in linode_firewall_rule_spec:
-                if field not in local_rule and field in remote_rule:
+            for field in RULE_SPEC_FIELDS - local_rule.keys():
+                if field in remote_rule:
                     local_rule[field] = remote_rule[field]
 
-            for ip_version in ["ipv6", "ipv4"]:
-                if ip_version in local_rule.get("addresses", {}):
-                    continue
+            remote_addresses = remote_rule.get("addresses", {})
+            local_addresses = local_rule.setdefault("addresses", {})
 
-                remote_addresses = remote_rule.get("addresses", {})
-                local_addresses = local_rule.get("addresses", {})
-                local_addresses[ip_version] = remote_addresses.get(
-                    ip_version, None
-                )
-                local_rule["addresses"] = local_addresses
+            for ip_version in ["ipv6", "ipv4"]:
+                # Don't introduce null values; the rules are compared as-is
+                if (
+                    ip_version not in local_addresses
+                    and ip_version in remote_addresses
+                ):
+                    local_addresses[ip_version] = remote_addresses[ip_version]
 
             result.append(local_rule)
+
+        # Add new local rules that don't exist remotely
+        result.extend(local_labeled_rules.values())
         return result
 
     def _update_rules(self, remote_rules: dict, local_rules: dict) -> dict:
@@ -611,55 +636,45 @@ class LinodeFirewall(LinodeModuleBase):
         if self._state != "update":
             return local_rules
 
-        # Add new local rules to remote rules if they don't exist
         for direction in ["inbound", "outbound"]:
-            rlr = {
-                remote_rule["label"]
-                for remote_rule in remote_rules.get(direction, {})
+            local_labeled_rules = {
+                r["label"]: r for r in local_rules[direction]
             }
-            for local_rule in local_rules.get(direction, {}):
-                if local_rule["label"] not in rlr:
-                    remote_rules[direction].append(local_rule)
-
-        for direction in ["inbound", "outbound"]:
             local_rules[direction] = self._amend_rules(
-                remote_rules[direction], local_rules[direction]
+                remote_rules[direction], local_labeled_rules
             )
         return local_rules
 
     def _change_rules(self) -> Optional[dict]:
         """Updates remote firewall rules relative to user-supplied new rules,
         and returns whether anything changed."""
-        local_rules = (
-            filter_null_values_recursive(self.module.params["rules"]) or {}
-        )
-        remote_rules = (
-            filter_null_values_recursive(mapping_to_dict(self._firewall.rules))
-            or {}
-        )
+        rules = self.module.params.get("rules")
 
-        # Ensure only user-defined rules will be used for diffing
-        configurable_fields = set(linode_firewall_rules_spec.keys())
+        # Leave the remote rules untouched if the user didn't supply any
+        if rules is None:
+            return None
 
-        remote_rules = {
-            k: v for k, v in remote_rules.items() if k in configurable_fields
-        }
+        local_rules = filter_null_values_recursive(rules)
+        remote_rules = mapping_to_dict(self._firewall.rules) or {}
+
+        # Ensure only user-defined rules will be used for diffing;
+        # select them first so only those are walked for null values
+        remote_rules = filter_null_values_recursive(
+            {
+                k: v
+                for k, v in remote_rules.items()
+                if k in linode_firewall_rules_spec
+            }
+        )
 
         # Normalize IP addresses for all rules
-        for direction in ["inbound", "outbound"]:
-            if direction in local_rules:
-                local_rules[direction] = self._normalize_ips(
-                    local_rules[direction]
-                )
-            else:
-                local_rules[direction] = []
-
-            if direction in remote_rules:
-                remote_rules[direction] = self._normalize_ips(
-                    remote_rules[direction]
-                )
-            else:
-                remote_rules[direction] = []
+        for direction in ("inbound", "outbound"):
+            local_rules[direction] = self._normalize_ips(
+                local_rules.get(direction, [])
+            )
+            remote_rules[direction] = self._normalize_ips(
+                remote_rules.get(direction, [])
+            )
 
         # Update local_rules with missing information from remote_rules
         local_rules = self._update_rules(remote_rules, local_rules)
@@ -669,19 +684,21 @@ class LinodeFirewall(LinodeModuleBase):
             if policy not in local_rules:
                 local_rules[policy] = remote_rules[policy]
 
-        local_rules = filter_null_values_recursive(local_rules)
-        remote_rules = filter_null_values_recursive(remote_rules)
         return local_rules if local_rules != remote_rules else None
 
     def _update_firewall(self) -> None:
         """Handles all update functionality for the current Firewall"""
 
+        params = self.module.params
+
+        # handle_updates drops null values itself
         handle_updates(
             self._firewall,
-            filter_null_values(self.module.params),
-            set(MUTABLE_FIELDS),
+            params,
+            MUTABLE_FIELDS,
             self.register_action,
             ignore_keys={"devices", "rules"},
+            refresh=False,
         )
 
         changes = self._change_rules()
@@ -690,7 +707,7 @@ class LinodeFirewall(LinodeModuleBase):
             self.register_action("Updated Firewall rules")
 
         # Update devices
-        devices: Optional[List[Any]] = self.module.params.get("devices")
+        devices: Optional[List[Any]] = params.get("devices")
         if devices is not None:
             self._update_devices(devices)
 
@@ -704,12 +721,21 @@ class LinodeFirewall(LinodeModuleBase):
             self._firewall = self._create_firewall()
             self.register_action("Created Firewall {0}".format(label))
 
+        # The Firewall was just fetched or created, so it only needs to be
+        # refreshed if anything was changed afterwards
+        num_actions = len(self.results["actions"])
+
         self._update_firewall()
 
-        self._firewall._api_get()
+        if len(self.results["actions"]) > num_actions:
+            self._firewall._api_get()
 
         self.results["firewall"] = self._firewall._raw_json
-        self.results["devices"] = paginated_list_to_json(self._firewall.devices)
+        self.results["devices"] = paginated_list_to_json(
+            self._devices
+            if self._devices is not None
+            else self._firewall.devices
+        )
 
     def _handle_absent(self) -> None:
         """Destroys the Firewall"""
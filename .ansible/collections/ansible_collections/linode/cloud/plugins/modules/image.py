@@ -6,12 +6,14 @@
 from __future__ import absolute_import, division, print_function
 
 import os
-from typing import Any, Optional, Set
+from typing import Any, Callable, Iterator, Optional, Set
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.image as docs
 import polling
 import requests
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
+    MAX_RETRIES,
+    RETRY_STATUSES,
     LinodeModuleBase,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
@@ -21,6 +23,7 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
     filter_null_values,
     handle_updates,
+    poll_condition,
 )
 from ansible_specdoc.objects import (
     FieldType,
@@ -29,6 +32,8 @@ from ansible_specdoc.objects import (
     SpecReturnValue,
 )
 from linode_api4 import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 SPEC = {
     "label": SpecField(
@@ -131,8 +136,13 @@ SPECDOC_META = SpecDocMeta(
     },
 )
 
+ANSIBLE_SPEC = SPECDOC_META.ansible_spec
+
 MUTABLE_FIELDS = {"description", "tags"}
 
+# The size of each chunk read from source_file during uploads
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
 DOCUMENTATION = r"""
 author:
 - Luke Murphy (@decentral1se)
@@ -297,11 +307,35 @@ image:
 """
 
 
+class FileChunks:
+    """
+    Iterates over the contents of a file in large chunks.
+    The file's length is exposed so requests sends a Content-Length
+    rather than using a chunked transfer encoding.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._size = os.path.getsize(path)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        with open(self._path, "rb") as file:
+            while True:
+                chunk = file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    return
+
+                yield chunk
+
+
 class Module(LinodeModuleBase):
     """Module for creating and destroying Linode Images"""
 
     def __init__(self) -> None:
-        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.module_arg_spec = ANSIBLE_SPEC
         self.results = {
             "changed": False,
             "actions": [],
@@ -327,56 +361,50 @@ class Module(LinodeModuleBase):
                 msg="failed to get image {0}: {1}".format(label, exception)
             )
 
-    def _wait_for_image_status(self, image: Image, status: Set[str]) -> None:
+    def _wait_for_image(
+        self, image: Image, condition: Callable[[Image], bool], name: str
+    ) -> None:
         def poll_func() -> bool:
             image._api_get()
-            return image.status in status
-
-        # Initial attempt
-        if poll_func():
-            return
+            return condition(image)
 
         try:
-            polling.poll(
+            poll_condition(
                 poll_func,
-                step=10,
+                step=0.5,
                 timeout=self._timeout_ctx.seconds_remaining,
+                backoff_factor=2.0,
+                max_step=30,
             )
         except polling.TimeoutException:
-            self.fail("failed to wait for image status: timeout period expired")
+            self.fail(
+                "failed to wait for image {0}: timeout period expired".format(
+                    name
+                )
+            )
+
+    def _wait_for_image_status(self, image: Image, status: Set[str]) -> None:
+        def condition(current: Image) -> bool:
+            return current.status in status
+
+        self._wait_for_image(image, condition, "status")
 
     def _wait_for_image_replication_status(
         self, image: Image, status: Set[str]
     ) -> None:
-        def poll_func() -> bool:
-            image._api_get()
-            for region in image.regions:
-                if region.status not in status:
-                    return False
-
-            return True
+        def condition(current: Image) -> bool:
+            return all(region.status in status for region in current.regions)
 
-        # Initial attempt
-        if poll_func():
-            return
-
-        try:
-            polling.poll(
-                poll_func,
-                step=10,
-                timeout=self._timeout_ctx.seconds_remaining,
-            )
-        except polling.TimeoutException:
-            self.fail(
-                "failed to wait for image replication status: timeout period expired"
-            )
+        self._wait_for_image(image, condition, "replication status")
 
     def _create_image_from_disk(self) -> Optional[Image]:
-        disk_id = self.module.params.get("disk_id")
-        label = self.module.params.get("label")
-        description = self.module.params.get("description")
-        cloud_init = self.module.params.get("cloud_init")
-        tags = self.module.params.get("tags")
+        params = self.module.params
+
+        disk_id = params.get("disk_id")
+        label = params.get("label")
+        description = params.get("description")
+        cloud_init = params.get("cloud_init")
+        tags = params.get("tags")
 
         try:
             return self.client.images.create(
@@ -392,12 +420,14 @@ class Module(LinodeModuleBase):
             )
 
     def _create_image_from_file(self) -> Optional[Image]:
-        label = self.module.params.get("label")
-        description = self.module.params.get("description")
-        region = self.module.params.get("region")
-        source_file = self.module.params.get("source_file")
-        cloud_init = self.module.params.get("cloud_init")
-        tags = self.module.params.get("tags")
+        params = self.module.params
+
+        label = params.get("label")
+        description = params.get("description")
+        region = params.get("region")
+        source_file = params.get("source_file")
+        cloud_init = params.get("cloud_init")
+        tags = params.get("tags")
 
         if not os.path.exists(source_file):
             return self.fail(
@@ -418,21 +448,31 @@ class Module(LinodeModuleBase):
                 msg="failed to create image upload: {0}".format(exception)
             )
 
+        # Retry the upload on the same statuses as API requests
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=["PUT"],
+        )
+
         try:
-            with open(source_file, "rb") as file:
+            with requests.Session() as session:
+                session.mount("https://", HTTPAdapter(max_retries=retry))
+
                 # We want to stream the image
-                requests.put(
+                response = session.put(
                     upload_to,
                     headers={"Content-Type": "application/octet-stream"},
-                    data=file,
+                    data=FileChunks(source_file),
                 )
+                response.raise_for_status()
 
         except Exception as exception:
             return self.fail(
                 msg="failed to upload image: {0}".format(exception)
             )
 
-        image = Image(self.client, image.id, json=image._raw_json)
         return image
 
     def _create_image(self) -> Optional[Image]:
@@ -445,11 +485,16 @@ class Module(LinodeModuleBase):
         return self.fail(msg="no handler found for image")
 
     def _update_image(self, image: Image) -> None:
-        image._api_get()
-
         params = filter_null_values(self.module.params)
 
-        handle_updates(image, params, MUTABLE_FIELDS, self.register_action)
+        # Nothing to do if no mutable field was specified
+        if not MUTABLE_FIELDS & params.keys():
+            return
+
+        # The image was just fetched or created, so no refresh is needed
+        handle_updates(
+            image, params, MUTABLE_FIELDS, self.register_action, refresh=False
+        )
 
     def _handle_present(self) -> None:
         params = self.module.params
@@ -463,6 +508,10 @@ class Module(LinodeModuleBase):
             self.register_action("Deleted image {0}".format(label))
             image = None
 
+        # The image only needs to be refreshed before returning
+        # if it was changed after it was last fetched
+        num_actions = len(self.results["actions"])
+
         # Create the image if it does not already exist
         if image is None:
             image = self._create_image()
@@ -471,34 +520,40 @@ class Module(LinodeModuleBase):
             if self.module.params.get("wait"):
                 self._wait_for_image_status(image, {"available"})
 
+                # The last poll already refreshed the image
+                num_actions = len(self.results["actions"])
+
         self._update_image(image)
 
         replica_regions = params.get("replica_regions")
-        new_regions: list = [] if replica_regions is None else replica_regions
-        old_regions = [r.region for r in image.regions]
+        new_regions = set(replica_regions or [])
+        old_regions = {r.region for r in image.regions}
 
         # Replicate image in new regions
         if replica_regions is not None and new_regions != old_regions:
-            if len(new_regions) == 0 or (
-                not set(new_regions) & set(old_regions)
-            ):
+            if not new_regions or new_regions.isdisjoint(old_regions):
                 return self.fail(
                     msg="failed to replicate image {0}: replica_regions value {1} is invalid. "
                     "At least one available region must be provided.".format(
-                        label, new_regions
+                        label, replica_regions
                     )
                 )
 
-            image.replicate(new_regions)
+            image.replicate(replica_regions)
             self.register_action(
-                "Replicated image {0} in regions {1}".format(label, new_regions)
+                "Replicated image {0} in regions {1}".format(
+                    label, replica_regions
+                )
             )
 
             if params.get("wait_for_replications"):
                 self._wait_for_image_replication_status(image, {"available"})
 
-        # Force lazy-loading
-        image._api_get()
+                # The last poll already refreshed the image
+                num_actions = len(self.results["actions"])
+
+        if len(self.results["actions"]) > num_actions:
+            image._api_get()
 
         self.results["image"] = image._raw_json
 
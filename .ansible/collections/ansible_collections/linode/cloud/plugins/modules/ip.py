@@ -14,9 +14,6 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
 )
-from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
-    filter_null_values,
-)
 from ansible_specdoc.objects import FieldType, SpecDocMeta, SpecField
 
 spec: dict = {
@@ -67,6 +64,8 @@ SPECDOC_META = SpecDocMeta(
     return_values={},
 )
 
+ANSIBLE_SPEC = SPECDOC_META.ansible_spec
+
 DOCUMENTATION = r"""
 author:
 - Luke Murphy (@decentral1se)
@@ -140,7 +139,7 @@ class Module(LinodeModuleBase):
     """Module for allocating a new IP"""
 
     def __init__(self) -> None:
-        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.module_arg_spec = ANSIBLE_SPEC
         self.results = {
             "changed": False,
             "actions": [],
@@ -154,7 +153,7 @@ class Module(LinodeModuleBase):
         )
 
     def _handle_present(self) -> None:
-        params = filter_null_values(self.module.params)
+        params = self.module.params
         linode_id = params.get("linode_id")
         public = params.get("public")
 
@@ -64,6 +64,8 @@ SPECDOC_META = SpecDocMeta(
     },
 )
 
+ANSIBLE_SPEC = SPECDOC_META.ansible_spec
+
 DOCUMENTATION = r"""
 author:
 - Luke Murphy (@decentral1se)
@@ -141,7 +143,7 @@ class ReverseDNSModule(LinodeModuleBase):
     """Module for updating Linode IP address's reverse DNS value"""
 
     def __init__(self) -> None:
-        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.module_arg_spec = ANSIBLE_SPEC
         self.required_one_of = ["state", "rdns"]
         self.results = {
             "changed": False,
@@ -5,6 +5,8 @@
 
 from __future__ import absolute_import, division, print_function
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Any, List, Optional
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.ip_share as ip_share_docs
@@ -66,6 +68,9 @@ SPECDOC_META = SpecDocMeta(
     },
 )
 
+# The maximum number of IPv6 ranges to fetch concurrently
+MAX_RANGE_WORKERS = 8
+
 DOCUMENTATION = r"""
 author:
 - Luke Murphy (@decentral1se)
@@ -167,18 +172,37 @@ class IPShareModule(LinodeModuleBase):
         self, ips: List[str], linode: Instance
     ) -> bool:
         current_ips = {i.address for i in linode.ips.ipv4.shared}
+        ipv6_ranges = linode.ips.ipv6.ranges
+        desired_ips = set(ips)
 
-        # ensure that IPv6 ranges are only shared by checking if is_bgp is True
-        for ipv6 in linode.ips.ipv6.ranges:
-            # We need to make a manual GET request
-            # because is_bgp is only available in the GET
-            # response body.
-            ipv6._api_get()
+        # The shared IPs can only match if every shared IPv4 address is
+        # desired and every desired IP is either a shared IPv4 address or
+        # one of the Linode's IPv6 ranges; otherwise there's no need to
+        # look up the ranges at all
+        if not current_ips <= desired_ips or not desired_ips <= (
+            current_ips | {ipv6.range for ipv6 in ipv6_ranges}
+        ):
+            return False
+
+        # We need to make a manual GET request for each range
+        # because is_bgp is only available in the GET
+        # response body. The requests are independent,
+        # so we can make them concurrently.
+        if len(ipv6_ranges) > 0:
+            with ThreadPoolExecutor(
+                max_workers=min(len(ipv6_ranges), MAX_RANGE_WORKERS)
+            ) as executor:
+                futures = [
+                    executor.submit(ipv6._api_get) for ipv6 in ipv6_ranges
+                ]
 
-            if ipv6.is_bgp:
-                current_ips.add(ipv6.range)
+                for future in futures:
+                    future.result()
+
+        # ensure that IPv6 ranges are only shared by checking if is_bgp is True
+        current_ips.update(ipv6.range for ipv6 in ipv6_ranges if ipv6.is_bgp)
 
-        return set(ips) == current_ips
+        return desired_ips == current_ips
 
     def _handle_present(self) -> None:
         linode_id = self.module.params.get("linode_id")
@@ -190,26 +214,43 @@ class IPShareModule(LinodeModuleBase):
             self._share_ip_addresses(ips, linode_id)
             self.register_action("Shared IPs with Linode {0}".format(linode_id))
 
-            linode = Instance(self.client, linode_id)
+            # Drop the cached IPs so they're fetched again
+            linode.invalidate()
+            linode_ips = linode.ips
+
             self.results["linode_id"] = linode.id
-            self.results["ips"] = [
-                i.address for i in linode.ips.ipv4.shared
-            ] + [i.range for i in linode.ips.ipv6.ranges]
+            self.results["ips"] = list(
+                chain(
+                    (i.address for i in linode_ips.ipv4.shared),
+                    (i.range for i in linode_ips.ipv6.ranges),
+                )
+            )
 
     def _handle_absent(self) -> None:
         linode_id = self.module.params.get("linode_id")
 
-        # Send an empty array to remove all shared IP addresses.
-        self._share_ip_addresses([], linode_id)
-        self.register_action(
-            "Removed shared ips from Linode {0}".format(linode_id)
-        )
-
         linode = Instance(self.client, linode_id)
+
+        # There's nothing to remove if no IPs are currently shared
+        if not self._check_shared_ip_addresses([], linode):
+            # Send an empty array to remove all shared IP addresses.
+            self._share_ip_addresses([], linode_id)
+            self.register_action(
+                "Removed shared ips from Linode {0}".format(linode_id)
+            )
+
+            # Drop the cached IPs so they're fetched again
+            linode.invalidate()
+
+        linode_ips = linode.ips
+
         self.results["linode_id"] = linode.id
-        self.results["ips"] = [i.address for i in linode.ips.ipv4.shared] + [
-            i.range for i in linode.ips.ipv6.ranges
-        ]
+        self.results["ips"] = list(
+            chain(
+                (i.address for i in linode_ips.ipv4.shared),
+                (i.range for i in linode_ips.ipv6.ranges),
+            )
+        )
 
     def exec_module(self, **kwargs: Any) -> Optional[dict]:
         """Entrypoint for configuring shared IPs for a Linode."""
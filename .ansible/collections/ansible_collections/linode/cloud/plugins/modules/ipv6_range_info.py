@@ -5,7 +5,7 @@
 
 from __future__ import absolute_import, division, print_function
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.ipv6_range_info as docs
 from ansible_collections.linode.cloud.plugins.module_utils.linode_common import (
@@ -15,16 +15,12 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_authors,
     global_requirements,
 )
-from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
-    filter_null_values,
-)
 from ansible_specdoc.objects import (
     FieldType,
     SpecDocMeta,
     SpecField,
     SpecReturnValue,
 )
-from linode_api4 import IPv6Range
 
 spec = {
     # Disable the default values
@@ -106,26 +102,26 @@ class Module(LinodeModuleBase):
 
         super().__init__(module_arg_spec=self.module_arg_spec)
 
-    def _get_range(self, address: str) -> IPv6Range:
+    def _get_range(self, address: str) -> Optional[Dict[str, Any]]:
         try:
-            result = self.client.load(IPv6Range, address)
-            return result
+            return self.client.get(
+                "/networking/ipv6/ranges/{0}".format(address)
+            )
         except Exception as exception:
             self.fail(
                 msg="failed to get range with address {0}: {1}".format(
                     address, exception
                 )
             )
+            return None
 
     def exec_module(self, **kwargs: Any) -> Optional[dict]:
         """Entrypoint for ipv6_range_info module"""
 
-        params = filter_null_values(self.module.params)
-
         # We want to omit the prefix length if specified
-        address = params.get("range").split("/", 1)[0]
+        address = self.module.params.get("range").partition("/")[0]
 
-        self.results["range"] = self._get_range(address)._raw_json
+        self.results["range"] = self._get_range(address)
 
         return self.results
 
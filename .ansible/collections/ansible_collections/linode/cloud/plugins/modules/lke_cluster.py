@@ -5,8 +5,20 @@
 
 from __future__ import absolute_import, division, print_function
 
-import copy
-from typing import Any, List, Optional, Set
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import ansible_collections.linode.cloud.plugins.module_utils.doc_fragments.lke_cluster as docs
 import polling
@@ -18,10 +30,12 @@ from ansible_collections.linode.cloud.plugins.module_utils.linode_docs import (
     global_requirements,
 )
 from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    dict_select_matching,
     filter_null_values,
     filter_null_values_recursive,
     handle_updates,
     jsonify_node_pool,
+    jsonify_node_pool_taint,
     poll_condition,
     validate_required,
 )
@@ -34,7 +48,7 @@ from ansible_specdoc.objects import (
     SpecField,
     SpecReturnValue,
 )
-from linode_api4 import ApiError, KubeVersion, LKECluster
+from linode_api4 import ApiError, KubeVersion, LKECluster, LKENodePool
 
 linode_lke_cluster_acl_addresses = {
     "ipv4": SpecField(
@@ -297,6 +311,11 @@ SPECDOC_META = SpecDocMeta(
     },
 )
 
+ANSIBLE_SPEC = SPECDOC_META.ansible_spec
+
+# The maximum number of node pool requests to make concurrently
+MAX_POOL_WORKERS = 8
+
 MUTABLE_FIELDS: Set[str] = {"tags"}
 
 REQUIRED_PRESENT: Set[str] = {"k8s_version", "region", "label", "node_pools"}
@@ -600,7 +619,7 @@ class LinodeLKECluster(LinodeModuleBase):
     """Module for creating and destroying Linode LKE clusters"""
 
     def __init__(self) -> None:
-        self.module_arg_spec = SPECDOC_META.ansible_spec
+        self.module_arg_spec = ANSIBLE_SPEC
         self.required_one_of: List[str] = []
         self.results = {
             "changed": False,
@@ -643,16 +662,26 @@ class LinodeLKECluster(LinodeModuleBase):
             return True
 
         try:
-            polling.poll(
+            poll_condition(
                 _check_cluster_nodes_ready,
-                step=4,
+                step=1,
                 timeout=timeout,
+                backoff_factor=2.0,
+                max_step=15,
             )
         except polling.TimeoutException:
             self.fail("failed to wait for lke cluster: timeout period expired")
 
     def _create_cluster(self) -> Optional[LKECluster]:
-        params = filter_null_values_recursive(self.module.params)
+        # Filter down to the relevant keys before stripping null values
+        # so we only walk the params used in the create request
+        params = filter_null_values_recursive(
+            {
+                k: v
+                for k, v in self.module.params.items()
+                if k in CREATE_FIELDS or k == "acl"
+            }
+        )
 
         label = params.pop("label")
 
@@ -673,9 +702,6 @@ class LinodeLKECluster(LinodeModuleBase):
             }
         )
 
-        # Let's filter down to valid keys
-        params = {k: v for k, v in params.items() if k in CREATE_FIELDS}
-
         try:
             self.register_action("Created LKE cluster {0}".format(label))
 
@@ -699,12 +725,16 @@ class LinodeLKECluster(LinodeModuleBase):
         Handles the update logic for an LKE cluster's control plane ACL configuration.
         """
         control_plane_acl = safe_get_cluster_acl(cluster)
-        configured_acl = copy.deepcopy(self.module.params.get("acl"))
+        configured_acl = self.module.params.get("acl")
 
         # We don't want to make any changes if the user has not explicitly defined an ACL
         if configured_acl is None:
             return
 
+        # Only the top level and the addresses are modified below,
+        # so we don't need a deep copy
+        configured_acl = dict(configured_acl)
+
         # [] and null are equivalent values for address fields,
         # so we need to account for this when diffing
         configured_addresses = configured_acl.get("addresses")
@@ -712,8 +742,11 @@ class LinodeLKECluster(LinodeModuleBase):
             ipv4 = configured_addresses.get("ipv4")
             ipv6 = configured_addresses.get("ipv6")
 
-            configured_acl["addresses"]["ipv4"] = [] if not ipv4 else ipv4
-            configured_acl["addresses"]["ipv6"] = [] if not ipv6 else ipv6
+            configured_acl["addresses"] = dict(
+                configured_addresses,
+                ipv4=[] if not ipv4 else ipv4,
+                ipv6=[] if not ipv6 else ipv6,
+            )
 
         user_defined_keys = set(linode_lke_cluster_acl.keys())
         current_acl = control_plane_acl if control_plane_acl is not None else {}
@@ -769,13 +802,60 @@ class LinodeLKECluster(LinodeModuleBase):
 
         self._attempt_update_acl(cluster)
 
+    def _update_pool_fields(
+        self, current_pool: LKENodePool, pool: Dict[str, Any]
+    ) -> bool:
+        """
+        Applies the configured autoscaler, taints, and labels to the given node pool.
+        Returns whether the node pool needs to be saved.
+        """
+
+        should_update = False
+
+        for field in ("autoscaler", "taints", "labels"):
+            if field not in pool:
+                continue
+
+            new_value = pool[field]
+
+            # Compare against the raw JSON because these fields are
+            # otherwise wrapped in objects that never equal a dict
+            old_value = current_pool._raw_json.get(field)
+
+            if field == "taints":
+                # linode_api4 parses taints into LKENodePoolTaint objects
+                # even in the raw JSON
+                old_value = [
+                    jsonify_node_pool_taint(taint) for taint in old_value or []
+                ]
+
+            if field == "autoscaler" and isinstance(old_value, dict):
+                # The autoscaler's min and max are optional, so we only
+                # compare the values specified by the user. Labels are
+                # replaced as a whole, so they're compared as-is.
+                old_value, new_value = dict_select_matching(
+                    filter_null_values_recursive(old_value),
+                    filter_null_values_recursive(new_value),
+                )
+
+            if old_value == new_value:
+                continue
+
+            self.register_action(
+                "Updated {} for Node Pool {}".format(field, current_pool.id)
+            )
+
+            setattr(current_pool, field, pool[field])
+            should_update = True
+
+        return should_update
+
     # pylint: disable=too-many-statements
     def _update_cluster(self, cluster: LKECluster) -> None:
         """Handles all update functionality for the current LKE cluster"""
 
-        new_params = filter_null_values_recursive(
-            copy.deepcopy(self.module.params)
-        )
+        # filter_null_values_recursive already returns a copy of the params
+        new_params = filter_null_values_recursive(self.module.params)
         new_params = {k: v for k, v in new_params.items() if k in CREATE_FIELDS}
 
         pools = new_params.pop("node_pools")
@@ -789,154 +869,126 @@ class LinodeLKECluster(LinodeModuleBase):
 
         self._cluster_put_updates(cluster)
 
-        existing_pools = copy.deepcopy(cluster.pools)
-        should_keep = [False for _ in existing_pools]
-        pools_handled = [False for _ in pools]
-
-        for k, pool in enumerate(pools):
-            for i, current_pool in enumerate(existing_pools):
-                if should_keep[i]:
-                    continue
-
-                # pool already exists
-                if (
-                    current_pool.count == pool["count"]
-                    and current_pool.type.id == pool["type"]
-                ):
-                    if (
-                        "autoscaler" in pool
-                        and current_pool.autoscaler != pool["autoscaler"]
-                    ):
-                        self.register_action(
-                            "Updated autoscaler for Node Pool {}".format(
-                                current_pool.id
-                            )
-                        )
-
-                        current_pool.autoscaler = pool.get("autoscaler")
-                        current_pool.save()
-
-                    if (
-                        "taints" in pool
-                        and current_pool.taints != pool["taints"]
-                    ):
-                        self.register_action(
-                            "Updated taints for Node Pool {}".format(
-                                current_pool.id
-                            )
-                        )
-
-                        current_pool.taints = pool.get("taints")
-                        current_pool.save()
-
-                    if (
-                        "labels" in pool
-                        and current_pool.labels != pool["labels"]
-                    ):
-                        self.register_action(
-                            "Updated labels for Node Pool {}".format(
-                                current_pool.id
-                            )
-                        )
-
-                        current_pool.labels = pool.get("labels")
-                        current_pool.save()
-
-                    pools_handled[k] = True
-                    should_keep[i] = True
-                    break
-
-        for i, pool in enumerate(pools):
-            if pools_handled[i]:
+        # Each access to cluster.pools builds new pool objects,
+        # so there's no need to copy them
+        existing_pools = list(cluster.pools)
+
+        # Index the existing pools by type and count so each configured pool
+        # can be matched without rescanning every existing pool
+        exact_matches: DefaultDict[Tuple[str, int], Deque[int]] = defaultdict(
+            deque
+        )
+        type_matches: DefaultDict[str, Deque[int]] = defaultdict(deque)
+
+        for i, existing_pool in enumerate(existing_pools):
+            pool_type = existing_pool.type.id
+
+            exact_matches[(pool_type, existing_pool.count)].append(i)
+            type_matches[pool_type].append(i)
+
+        kept: Set[int] = set()
+        unmatched_pools = []
+
+        # Node pool changes are independent of each other, so the requests
+        # are collected here and made concurrently once every pool is matched
+        pool_requests: List[Callable[[], Any]] = []
+
+        for pool in pools:
+            candidates = exact_matches.get((pool["type"], pool["count"]))
+
+            if not candidates:
+                unmatched_pools.append(pool)
                 continue
 
-            created = False
-
-            for k, existing_pool in enumerate(existing_pools):
-                if should_keep[k]:
-                    continue
-
-                if existing_pool.type.id == pool["type"]:
-                    # We found a match
-                    should_update = False
-
-                    if existing_pool.count != pool["count"]:
-                        self.register_action(
-                            "Resized pool {} from {} -> {}".format(
-                                existing_pool.id,
-                                existing_pool.count,
-                                pool["count"],
-                            )
-                        )
-
-                        existing_pool.count = pool["count"]
-                        should_update = True
-
-                    if (
-                        "autoscaler" in pool
-                        and existing_pool.autoscaler != pool["autoscaler"]
-                    ):
-                        self.register_action(
-                            "Updated autoscaler for Node Pool {}".format(
-                                existing_pool.id
-                            )
-                        )
-                        existing_pool.autoscaler = pool["autoscaler"]
-                        should_update = True
-
-                    if (
-                        "taints" in pool
-                        and existing_pool.taints != pool["taints"]
-                    ):
-                        self.register_action(
-                            "Updated taints for Node Pool {}".format(
-                                existing_pool.id
-                            )
-                        )
-
-                        existing_pool.taints = pool["taints"]
-                        should_update = True
-
-                    if (
-                        "labels" in pool
-                        and existing_pool.labels != pool["labels"]
-                    ):
-                        self.register_action(
-                            "Updated labels for Node Pool {}".format(
-                                existing_pool.id
-                            )
-                        )
-
-                        existing_pool.labels = pool["labels"]
-                        should_update = True
-
-                    if should_update:
-                        existing_pool.save()
-
-                    should_keep[k] = True
-
-                    created = True
-                    break
-
-            if not created:
+            # pool already exists
+            i = candidates.popleft()
+            current_pool = existing_pools[i]
+
+            if self._update_pool_fields(current_pool, pool):
+                pool_requests.append(current_pool.save)
+
+            kept.add(i)
+
+        for pool in unmatched_pools:
+            candidates = type_matches.get(pool["type"], deque())
+
+            # Skip any pools that have already been matched
+            while candidates and candidates[0] in kept:
+                candidates.popleft()
+
+            if not candidates:
                 self.register_action(
                     "Created pool with {} nodes and type {}".format(
                         pool["count"], pool["type"]
                     )
                 )
 
-                cluster.node_pool_create(
-                    pool["type"],
-                    pool["count"],
-                    autoscaler=pool.get("autoscaler"),
+                pool_requests.append(
+                    partial(
+                        cluster.node_pool_create,
+                        pool["type"],
+                        pool["count"],
+                        autoscaler=pool.get("autoscaler"),
+                    )
                 )
 
+                continue
+
+            # We found a match
+            i = candidates.popleft()
+            existing_pool = existing_pools[i]
+            should_update = False
+
+            if existing_pool.count != pool["count"]:
+                self.register_action(
+                    "Resized pool {} from {} -> {}".format(
+                        existing_pool.id,
+                        existing_pool.count,
+                        pool["count"],
+                    )
+                )
+
+                existing_pool.count = pool["count"]
+                should_update = True
+
+            if self._update_pool_fields(existing_pool, pool):
+                should_update = True
+
+            if should_update:
+                pool_requests.append(existing_pool.save)
+
+            kept.add(i)
+
+        self._run_concurrently(pool_requests)
+
+        # Pools are only deleted after all other changes have been made
+        # so the cluster is never left without a node pool
+        delete_requests: List[Callable[[], Any]] = []
+
         for i, pool in enumerate(existing_pools):
-            if should_keep[i]:
+            if i in kept:
                 continue
 
             self.register_action("Deleted pool {}".format(pool.id))
-            pool.delete()
+            delete_requests.append(pool.delete)
+
+        self._run_concurrently(delete_requests)
+
+    @staticmethod
+    def _run_concurrently(requests: List[Callable[[], Any]]) -> None:
+        """Calls the given request functions concurrently"""
+
+        if len(requests) < 1:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(requests), MAX_POOL_WORKERS)
+        ) as executor:
+            futures = [executor.submit(request) for request in requests]
+
+            # Raise the first error encountered, if any
+            for future in futures:
+                future.result()
 
     def _populate_kubeconfig_no_poll(self, cluster: LKECluster) -> None:
         try:
@@ -959,7 +1011,13 @@ class LinodeLKECluster(LinodeModuleBase):
 
             return True
 
-        poll_condition(condition, 4, self._timeout_ctx.seconds_remaining)
+        poll_condition(
+            condition,
+            step=1,
+            timeout=self._timeout_ctx.seconds_remaining,
+            backoff_factor=2.0,
+            max_step=15,
+        )
 
     def _populate_dashboard_url_no_poll(self, cluster: LKECluster) -> None:
         try:
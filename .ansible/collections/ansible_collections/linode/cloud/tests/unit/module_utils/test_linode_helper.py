@@ -0,0 +1,105 @@
+"""Unit tests for the linode_helper module utils."""
+
+import time
+
+import polling
+import pytest
+from ansible_collections.linode.cloud.plugins.module_utils.linode_helper import (
+    poll_condition,
+)
+
+
+class FakeClock:
+    """A clock that only advances when slept on."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+
+    # polling and poll_condition share the time module
+    monkeypatch.setattr(time, "time", clock.time)
+    monkeypatch.setattr(time, "monotonic", clock.time)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+
+    return clock
+
+
+def test_poll_condition_succeeds_on_first_attempt(clock: FakeClock) -> None:
+    attempts = []
+
+    def condition() -> bool:
+        attempts.append(clock.now)
+        return True
+
+    poll_condition(condition, step=1, timeout=10)
+
+    assert attempts == [1000.0]
+
+
+def test_poll_condition_checks_at_deadline(clock: FakeClock) -> None:
+    attempts = []
+    start = clock.now
+
+    def condition() -> bool:
+        attempts.append(round(clock.now - start, 6))
+        return clock.now - start >= 0.95
+
+    poll_condition(condition, step=0.3, timeout=1)
+
+    # The final sleep is clamped to the deadline and the condition is
+    # checked one last time there
+    assert attempts == [0, 0.3, 0.6, 0.9, 1.0]
+
+
+def test_poll_condition_timeout(clock: FakeClock) -> None:
+    attempts = []
+    start = clock.now
+
+    def condition() -> bool:
+        attempts.append(round(clock.now - start, 6))
+        return False
+
+    with pytest.raises(polling.TimeoutException):
+        poll_condition(condition, step=0.3, timeout=1)
+
+    # No attempts are made past the deadline
+    assert attempts == [0, 0.3, 0.6, 0.9, 1.0]
+    assert round(clock.now - start, 6) == 1.0
+
+
+def test_poll_condition_zero_timeout(clock: FakeClock) -> None:
+    attempts = []
+
+    def condition() -> bool:
+        attempts.append(clock.now)
+        return False
+
+    with pytest.raises(polling.TimeoutException):
+        poll_condition(condition, step=1, timeout=0)
+
+    assert attempts == [1000.0]
+
+
+def test_poll_condition_backoff(clock: FakeClock) -> None:
+    attempts = []
+    start = clock.now
+
+    def condition() -> bool:
+        attempts.append(round(clock.now - start, 6))
+        return len(attempts) == 5
+
+    poll_condition(
+        condition, step=1, timeout=100, backoff_factor=2.0, max_step=4
+    )
+
+    assert attempts == [0, 1, 3, 7, 11]
@@ -0,0 +1,70 @@
+"""Unit tests for the lke_cluster module."""
+
+from typing import Any, Dict
+
+import pytest
+from ansible_collections.linode.cloud.plugins.modules.lke_cluster import (
+    LinodeLKECluster,
+)
+from linode_api4 import LinodeClient, LKENodePool
+
+POOL_JSON = {
+    "id": 10,
+    "type": "g6-standard-1",
+    "count": 3,
+    "autoscaler": {"enabled": False, "min": 3, "max": 3},
+    "labels": {"foo": "bar", "baz": "qux"},
+    "taints": [{"key": "foo", "value": "bar", "effect": "NoSchedule"}],
+    "nodes": [],
+}
+
+
+@pytest.fixture(name="module")
+def fixture_module() -> LinodeLKECluster:
+    # Skip __init__ to avoid building an AnsibleModule
+    module = LinodeLKECluster.__new__(LinodeLKECluster)
+    module.results = {"changed": False, "actions": []}
+
+    return module
+
+
+def make_pool() -> LKENodePool:
+    return LKENodePool(LinodeClient("token"), 10, 1, json=POOL_JSON)
+
+
+@pytest.mark.parametrize(
+    "pool",
+    [
+        {},
+        {"autoscaler": {"enabled": False}},
+        {"autoscaler": {"enabled": False, "min": 3, "max": 3}},
+        {"labels": {"foo": "bar", "baz": "qux"}},
+        {"taints": [{"key": "foo", "value": "bar", "effect": "NoSchedule"}]},
+    ],
+)
+def test_update_pool_fields_unchanged(
+    module: LinodeLKECluster, pool: Dict[str, Any]
+) -> None:
+    assert not module._update_pool_fields(make_pool(), pool)
+    assert module.results["actions"] == []
+
+
+@pytest.mark.parametrize(
+    "pool,field",
+    [
+        ({"autoscaler": {"enabled": True}}, "autoscaler"),
+        ({"autoscaler": {"enabled": False, "max": 5}}, "autoscaler"),
+        ({"labels": {"foo": "bar"}}, "labels"),
+        ({"taints": []}, "taints"),
+    ],
+)
+def test_update_pool_fields_changed(
+    module: LinodeLKECluster, pool: Dict[str, Any], field: str
+) -> None:
+    current_pool = make_pool()
+
+    assert module._update_pool_fields(current_pool, pool)
+    assert module.results["actions"] == [
+        "Updated {} for Node Pool 10".format(field)
+    ]
+    assert getattr(current_pool, field) == pool[field]